@@ -4,27 +4,153 @@ Advanced Google Dork CLI Tool
 With proxy support, caching, and advanced bot detection bypass
 """
 
+import io
 import os
+import re
 import json
+import hashlib
 import csv
 import time
 import random
+import sqlite3
+import threading
+import zlib
 import click
 import requests
-from urllib.parse import quote, urlparse
-from datetime import datetime
+import soupsieve
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from functools import lru_cache
+from urllib.parse import quote
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:  # optional, html.parser is pure Python but always available
+    HTML_PARSER = 'html.parser'
+
 
 DEFAULT_BING_ENDPOINT = "https://api.bing.microsoft.com/v7.0/search"
 DEFAULT_BRAVE_ENDPOINT = "https://api.search.brave.com/res/v1/web/search"
 DEFAULT_SEARXNG_ENDPOINT = "http://localhost:8080"
 
+# CSS selectors compiled once instead of on every parsed page
+GOOGLE_RESULT_SELECTOR = soupsieve.compile('div.g')
+GOOGLE_TITLE_SELECTOR = soupsieve.compile('h3')
+GOOGLE_LINK_SELECTOR = soupsieve.compile('a')
+GOOGLE_SNIPPET_SELECTOR = soupsieve.compile('span.st')
+DDG_RESULT_SELECTOR = soupsieve.compile('div.result')
+DDG_LINK_SELECTOR = soupsieve.compile('a.result__a')
+DDG_SNIPPET_SELECTOR = soupsieve.compile('.result__snippet')
+
+
+def has_class(name: str):
+    """Strainer predicate; while parsing, bs4 passes the raw unsplit class string"""
+    return lambda value: value is not None and name in value.split()
+
+
+# Only build tree nodes for result blocks; the rest of the page is skipped
+GOOGLE_RESULT_STRAINER = SoupStrainer('div', class_=has_class('g'))
+DDG_RESULT_STRAINER = SoupStrainer('div', class_=has_class('result'))
+
+
+# Retry strategy for transient failures. Jitter keeps parallel workers from
+# retrying in lockstep; the last response is returned rather than raised so
+# _request can read its Retry-After header. urllib3 must not sleep on that
+# header itself: it would hold the worker for the full server-chosen wait,
+# bypassing MAX_RETRY_AFTER and RateLimiter.defer.
+RETRY_STRATEGY = Retry(
+    total=3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    backoff_factor=0.5,
+    backoff_jitter=1.0,
+    backoff_max=10,
+    respect_retry_after_header=False,
+    raise_on_status=False
+)
+
+# Upper bound on how long a Retry-After header may pause a route
+MAX_RETRY_AFTER = 300.0
+
+# One adapter for every session so clients share a warm keep-alive pool
+SHARED_ADAPTER = HTTPAdapter(
+    max_retries=RETRY_STRATEGY,
+    pool_connections=50,
+    pool_maxsize=50,
+    pool_block=False
+)
+
+HTTP_SCHEMES = ('http://', 'https://')
+
+# Result links on these hosts (and subdomains) are Google's own pages
+GOOGLE_HOSTS = ('google.com', 'googleusercontent.com')
+
+# Matches the scheme and captures the netloc, like urlparse(url).netloc
+NETLOC_RE = re.compile(r'\A[A-Za-z][A-Za-z0-9+.-]*://([^/?#]*)')
+
+
+def json_dumps(data) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def json_loads(data: bytes):
+    """Deserialize JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def extract_domain(url: str) -> str:
+    """Return the netloc of a URL without building a full urlparse result"""
+    match = NETLOC_RE.match(url)
+    return match.group(1) if match else ''
+
+
+def is_google_host(domain: str) -> bool:
+    """True if a netloc (as returned by extract_domain) belongs to Google"""
+    host = domain.rpartition('@')[2].partition(':')[0].lower()
+    return any(host == name or host.endswith('.' + name) for name in GOOGLE_HOSTS)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+@lru_cache(maxsize=4096)
+def cache_key(query: str) -> str:
+    """Hex digest naming a query's cache entry (memoized: get and set share it)"""
+    return hashlib.blake2b(query.encode(), digest_size=16).hexdigest()
 
+
+@lru_cache(maxsize=8)
 def load_config(path: str) -> Dict:
+    # Cached: every resolve_*_config call reads the same file
     if not path:
         return {}
     if not os.path.exists(path):
@@ -78,22 +204,140 @@ def resolve_searxng_config(config_path: str) -> Dict[str, Optional[str]]:
     return {"api_key": api_key, "endpoint": endpoint}
 
 
+def parse_google_results(html: bytes) -> List[Dict[str, str]]:
+    """Extract organic results from a Google SERP"""
+    results = []
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=GOOGLE_RESULT_STRAINER)
+    for result in GOOGLE_RESULT_SELECTOR.select(soup):
+        title_elem = GOOGLE_TITLE_SELECTOR.select_one(result)
+        link_elem = GOOGLE_LINK_SELECTOR.select_one(result)
+        if title_elem is None or link_elem is None:
+            continue
+        
+        url_str = link_elem.get('href', '')
+        if not url_str.startswith(HTTP_SCHEMES):
+            continue
+        domain = extract_domain(url_str)
+        if is_google_host(domain):
+            continue
+        
+        snippet_elem = GOOGLE_SNIPPET_SELECTOR.select_one(result)
+        results.append({
+            'title': title_elem.get_text(strip=True),
+            'url': url_str,
+            'snippet': snippet_elem.get_text(strip=True) if snippet_elem else 'N/A',
+            'domain': domain,
+        })
+    return results
+
+
+def parse_duckduckgo_results(html: bytes) -> List[Dict[str, str]]:
+    """Extract results from a DuckDuckGo HTML results page"""
+    results = []
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=DDG_RESULT_STRAINER)
+    for result in DDG_RESULT_SELECTOR.select(soup):
+        link = DDG_LINK_SELECTOR.select_one(result)
+        if not link:
+            continue
+        title = link.get_text(strip=True)
+        url_str = link.get('href', '')
+        snippet_elem = DDG_SNIPPET_SELECTOR.select_one(result)
+        snippet = snippet_elem.get_text(strip=True) if snippet_elem else 'N/A'
+        if url_str and url_str.startswith('http'):
+            results.append({
+                'title': title,
+                'url': url_str,
+                'snippet': snippet,
+                'domain': extract_domain(url_str),
+            })
+    return results
+
+
 class ProxyRotation:
-    """Manages proxy rotation for requests"""
+    """Manages weighted proxy rotation based on observed latency and errors"""
+    
+    __slots__ = ('proxy_list', '_lock', '_entries', '_by_url')
+    
+    MAX_ERRORS = 3       # consecutive failures before a proxy is benched
+    COOLDOWN = 60.0      # seconds a benched proxy sits out
+    EWMA_ALPHA = 0.3     # weight of the newest latency sample
     
     def __init__(self, proxy_list: List[str] = None):
         self.proxy_list = proxy_list or []
-        self.current_index = 0
+        self._lock = threading.Lock()
+        self._reset_entries()
+    
+    def _reset_entries(self):
+        """Build rotation state for the current proxy list"""
+        self._entries = [
+            {
+                'proxy': proxy,
+                'current_weight': 0.0,
+                'ewma_ms': 0.0,
+                'errors': 0,
+                'benched_until': 0.0,
+            }
+            for proxy in map(self._parse_proxy, self.proxy_list)
+        ]
+        # Random starting point so parallel runs don't all hit the same proxy first
+        if self._entries:
+            offset = random.randrange(len(self._entries))
+            self._entries = self._entries[offset:] + self._entries[:offset]
+        self._by_url = {entry['proxy']['http']: entry for entry in self._entries}
+    
+    @staticmethod
+    def _effective_weight(entry: Dict) -> float:
+        """Faster proxies get proportionally more traffic"""
+        return 1000.0 / (entry['ewma_ms'] + 100.0)
     
     def get_next_proxy(self) -> Optional[Dict]:
-        """Get next proxy in rotation or None if no proxies"""
-        if not self.proxy_list:
+        """Get next proxy using smooth weighted round-robin, or None if no proxies"""
+        if not self._entries:
             return None
+        if len(self._entries) == 1:
+            # Nothing to rotate; skip the weighting bookkeeping
+            return self._entries[0]['proxy']
         
-        proxy = self.proxy_list[self.current_index]
-        self.current_index = (self.current_index + 1) % len(self.proxy_list)
+        with self._lock:
+            now = time.monotonic()
+            available = [e for e in self._entries if e['benched_until'] <= now]
+            if not available:
+                # Every proxy is benched: use the one that recovers first
+                best = min(self._entries, key=lambda e: e['benched_until'])
+            else:
+                total = 0.0
+                best = None
+                for entry in available:
+                    weight = self._effective_weight(entry)
+                    entry['current_weight'] += weight
+                    total += weight
+                    if best is None or entry['current_weight'] > best['current_weight']:
+                        best = entry
+                best['current_weight'] -= total
         
-        return self._parse_proxy(proxy)
+        return best['proxy']
+    
+    def report(self, proxy: Dict, latency_ms: float, ok: bool):
+        """Record the outcome of a request made through proxy"""
+        entry = self._by_url.get(proxy.get('http'))
+        if entry is None:
+            return
+        
+        with self._lock:
+            if entry['ewma_ms']:
+                entry['ewma_ms'] += self.EWMA_ALPHA * (latency_ms - entry['ewma_ms'])
+            else:
+                entry['ewma_ms'] = latency_ms
+            
+            if ok:
+                entry['errors'] = 0
+                return
+            
+            entry['errors'] += 1
+            if entry['errors'] >= self.MAX_ERRORS:
+                entry['benched_until'] = time.monotonic() + self.COOLDOWN
+                # One more failure after the cooldown benches it again
+                entry['errors'] = self.MAX_ERRORS - 1
     
     @staticmethod
     def _parse_proxy(proxy_url: str) -> Dict:
@@ -110,48 +354,146 @@ class ProxyRotation:
         """Load proxies from file (one per line)"""
         try:
             with open(file_path, 'r') as f:
-                self.proxy_list = [line.strip() for line in f if line.strip()]
+                lines = (line.strip() for line in f)
+                self.proxy_list = [line for line in lines if line and not line.startswith('#')]
+            # Parse once here so rotation only hands out prebuilt dicts
+            self._reset_entries()
             click.echo(f'✓ Loaded {len(self.proxy_list)} proxies')
         except Exception as e:
             click.echo(f'Error loading proxies: {str(e)}', err=True)
 
 
+class EngineBlockedError(requests.exceptions.RequestException):
+    """Raised instead of sending a request while a host's circuit is open"""
+
+
+class CircuitBreaker:
+    """Stops sending requests to a host after repeated consecutive error responses"""
+    
+    def __init__(self, max_failures: int = 5, reset_after: float = 300.0):
+        self.max_failures = max_failures
+        self.reset_after = reset_after
+        self._hosts = {}  # host -> (consecutive failures, open until)
+        self._lock = threading.Lock()
+    
+    def check(self, host: str):
+        """Raise EngineBlockedError if the circuit for host is open"""
+        with self._lock:
+            failures, open_until = self._hosts.get(host, (0, 0.0))
+        remaining = open_until - time.monotonic()
+        if remaining > 0:
+            raise EngineBlockedError(
+                f'{host} failed {failures} times in a row; skipping for {remaining:.0f}s'
+            )
+    
+    def record_success(self, host: str):
+        with self._lock:
+            self._hosts.pop(host, None)
+    
+    def record_failure(self, host: str):
+        with self._lock:
+            failures = self._hosts.get(host, (0, 0.0))[0] + 1
+            open_until = time.monotonic() + self.reset_after if failures >= self.max_failures else 0.0
+            self._hosts[host] = (failures, open_until)
+
+
+class RateLimiter:
+    """Spaces out request start times per connection route (proxy or direct)"""
+    
+    def __init__(self, delay: float, jitter: float = 1.0):
+        self.delay = delay
+        self.jitter = jitter
+        self._next_slots = {}  # route -> monotonic time of its next free slot
+        self._lock = threading.Lock()
+    
+    def wait(self, route: str = 'direct'):
+        """Block until this caller's request slot on route comes up"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slots.get(route, 0.0))
+            self._next_slots[route] = slot + self.delay + random.uniform(0, self.jitter)
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def defer(self, route: str, seconds: float):
+        """Hold off the next request on route, e.g. to honor Retry-After"""
+        with self._lock:
+            resume_at = time.monotonic() + seconds
+            self._next_slots[route] = max(self._next_slots.get(route, 0.0), resume_at)
+
+
 class CacheManager:
-    """Manages caching of search results"""
+    """Manages caching of search results in a single SQLite database"""
     
-    def __init__(self, cache_dir: str = '.cache'):
+    def __init__(self, cache_dir: str = '.cache', max_memory_entries: int = 1024):
         self.cache_dir = cache_dir
+        self.max_memory_entries = max_memory_entries
+        # In-process LRU of decoded entries: cache key -> (timestamp, results)
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
         os.makedirs(cache_dir, exist_ok=True)
+        
+        # One connection shared by all worker threads, serialized by self._lock
+        self._db = sqlite3.connect(
+            os.path.join(cache_dir, 'results.sqlite3'),
+            check_same_thread=False
+        )
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            'key TEXT PRIMARY KEY, query TEXT, timestamp REAL, data BLOB)'
+        )
+        self._db.commit()
     
-    def get_cache_file(self, query: str) -> str:
-        """Generate cache file path for query"""
-        import hashlib
-        query_hash = hashlib.md5(query.encode()).hexdigest()
-        return os.path.join(self.cache_dir, f'{query_hash}.json')
+    def _remember(self, key: str, timestamp: float, results: List[Dict]):
+        """Store decoded entry in the in-memory LRU"""
+        with self._lock:
+            self._memory[key] = (timestamp, results)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
     
     def get(self, query: str) -> Optional[List[Dict]]:
         """Get cached results for query"""
-        cache_file = self.get_cache_file(query)
-        try:
-            if os.path.exists(cache_file):
-                with open(cache_file, 'r') as f:
-                    data = json.load(f)
-                    if datetime.now().timestamp() - data['timestamp'] < 86400:  # 24 hour cache
-                        return data['results']
-        except Exception:
-            pass
+        key = cache_key(query)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+        
+        if entry is None:
+            try:
+                with self._lock:
+                    row = self._db.execute(
+                        'SELECT timestamp, data FROM results WHERE key = ?', (key,)
+                    ).fetchone()
+                if row is None:
+                    return None
+                entry = (row[0], json_loads(zlib.decompress(row[1])))
+            except Exception:
+                return None
+            self._remember(key, *entry)
+        
+        timestamp, results = entry
+        if time.time() - timestamp < 86400:  # 24 hour cache
+            return results
         return None
     
     def set(self, query: str, results: List[Dict]):
         """Cache results for query"""
-        cache_file = self.get_cache_file(query)
+        key = cache_key(query)
+        timestamp = time.time()
+        self._remember(key, timestamp, results)
         try:
-            with open(cache_file, 'w') as f:
-                json.dump({
-                    'query': query,
-                    'results': results,
-                    'timestamp': datetime.now().timestamp(),
-                }, f)
+            # SERP text compresses well; zlib keeps the cache small without new deps
+            payload = zlib.compress(json_dumps(results), 3)
+            with self._lock:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO results (key, query, timestamp, data) VALUES (?, ?, ?, ?)',
+                    (key, query, timestamp, payload)
+                )
+                self._db.commit()
         except Exception as e:
             click.echo(f'Cache write error: {str(e)}', err=True)
 
@@ -159,7 +501,7 @@ class CacheManager:
 class AdvancedGoogleDorkClient:
     """Advanced Google Dork client with proxy and cache support"""
     
-    USER_AGENTS = [
+    USER_AGENTS = (
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
         'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -168,15 +510,35 @@ class AdvancedGoogleDorkClient:
         'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15',
         'Mozilla/5.0 (iPhone; CPU iPhone OS 17_2_1 like Mac OS X) AppleWebKit/605.1.15(KHTML, like Gecko) Version/17.2 Mobile/15E148 Safari/604.1',
         'Mozilla/5.0 (Linux; Android 13; SM-S911B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36',
-    ]
+    )
     
-    REFERERS = [
+    REFERERS = (
         'https://www.google.com/',
         'https://www.bing.com/',
         'https://www.yahoo.com/',
         'https://duckduckgo.com/',
         'https://www.startpage.com/',
-    ]
+    )
+    
+    ACCEPT_LANGUAGES = (
+        'en-US,en;q=0.9',
+        'en-GB,en;q=0.9',
+    )
+    
+    HEADER_POOL_SIZE = 32
+    
+    # Header fields that are identical on every request
+    BASE_HEADERS = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Sec-Fetch-User': '?1',
+    }
     
     def __init__(
         self,
@@ -191,12 +553,25 @@ class AdvancedGoogleDorkClient:
         brave_endpoint: Optional[str] = None,
         searxng_api_key: Optional[str] = None,
         searxng_endpoint: Optional[str] = None,
+        concurrency: int = 4,
     ):
         self.delay = delay
         self.timeout = timeout
+        self.concurrency = max(1, concurrency)
         self.proxies = proxies or ProxyRotation()
         self.cache = CacheManager() if use_cache else None
+        self.rate_limiter = RateLimiter(delay)
+        self.circuit_breaker = CircuitBreaker()
+        # Per-thread flag telling search() whether the last request failed
+        self._state = threading.local()
         self.engine = engine.lower()
+        # Resolve the engine once instead of comparing strings per query
+        self._search_fn = {
+            'bing': self._search_bing,
+            'brave': self._search_brave,
+            'duckduckgo': self._search_duckduckgo,
+            'searxng': self._search_searxng,
+        }.get(self.engine, self._search_google)
         self.bing_api_key = bing_api_key
         self.bing_endpoint = bing_endpoint or DEFAULT_BING_ENDPOINT
         self.brave_api_key = brave_api_key
@@ -204,42 +579,71 @@ class AdvancedGoogleDorkClient:
         self.searxng_api_key = searxng_api_key
         self.searxng_endpoint = searxng_endpoint or DEFAULT_SEARXNG_ENDPOINT
         self.session = self._create_session()
+        # Private generator: no contention on the module-level random state
+        self._rng = random.Random()
+        # Prebuilt header sets; requests never mutates them, so they can be shared
+        self._header_pool = tuple(self._build_headers() for _ in range(self.HEADER_POOL_SIZE))
     
     def _create_session(self) -> requests.Session:
         """Create session with retry strategy"""
         session = requests.Session()
-        
-        # Retry strategy for transient failures
-        retry_strategy = Retry(
-            total=3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"],
-            backoff_factor=1
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+        # Ask servers to hold idle connections open between queries
+        session.headers.update({'Connection': 'keep-alive', 'Keep-Alive': 'timeout=30, max=100'})
+        session.mount("http://", SHARED_ADAPTER)
+        session.mount("https://", SHARED_ADAPTER)
         
         return session
     
-    def _get_random_headers(self) -> Dict:
-        """Generate random headers"""
+    def _build_headers(self) -> Dict:
+        """Build one randomized header set"""
         return {
-            'User-Agent': random.choice(self.USER_AGENTS),
-            'Referer': random.choice(self.REFERERS),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': random.choice(['en-US,en;q=0.9', 'en-GB,en;q=0.9']),
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
+            **self.BASE_HEADERS,
+            'User-Agent': self._rng.choice(self.USER_AGENTS),
+            'Referer': self._rng.choice(self.REFERERS),
+            'Accept-Language': self._rng.choice(self.ACCEPT_LANGUAGES),
         }
     
+    def _get_random_headers(self) -> Dict:
+        """Pick a random prebuilt header set"""
+        return self._rng.choice(self._header_pool)
+    
+    def _request(self, url: str, **kwargs) -> requests.Response:
+        """GET url through the next proxy and report the outcome back to the rotation"""
+        host = extract_domain(url)
+        try:
+            # Fail fast without waiting for a slot while the host is blocking us
+            self.circuit_breaker.check(host)
+            
+            proxy = self.proxies.get_next_proxy() if self.proxies else None
+            # Each proxy has its own quota upstream, so each gets its own pacing
+            route = proxy['http'] if proxy else 'direct'
+            self.rate_limiter.wait(route)
+            
+            started = time.monotonic()
+            try:
+                response = self.session.get(url, proxies=proxy, timeout=self.timeout, **kwargs)
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                if e.response is not None and e.response.status_code in (429, 503):
+                    retry_after = parse_retry_after(e.response.headers.get('Retry-After'))
+                    if retry_after:
+                        self.rate_limiter.defer(route, retry_after)
+                if proxy:
+                    self.proxies.report(proxy, (time.monotonic() - started) * 1000, ok=False)
+                # Only an error response means the engine is blocking us; transport
+                # and proxy failures are the rotation's job (it benches bad proxies)
+                if e.response is not None:
+                    self.circuit_breaker.record_failure(host)
+                raise
+        except requests.exceptions.RequestException:
+            self._state.request_failed = True
+            raise
+        
+        if proxy:
+            self.proxies.report(proxy, (time.monotonic() - started) * 1000, ok=True)
+        self.circuit_breaker.record_success(host)
+        return response
+    
     def search(self, query: str) -> List[Dict[str, str]]:
         """Perform search with cache and proxy support"""
         
@@ -249,21 +653,11 @@ class AdvancedGoogleDorkClient:
             if cached:
                 return cached
         
-        # Add delay
-        time.sleep(self.delay + random.uniform(0, 1))
+        self._state.request_failed = False
+        results = self._search_fn(query)
         
-        if self.engine == 'bing':
-            results = self._search_bing(query)
-        elif self.engine == 'brave':
-            results = self._search_brave(query)
-        elif self.engine == 'duckduckgo':
-            results = self._search_duckduckgo(query)
-        elif self.engine == 'searxng':
-            results = self._search_searxng(query)
-        else:
-            results = self._search_google(query)
-        
-        if self.cache:
+        # Don't cache failures (including open circuits) so a later run retries
+        if self.cache and not self._state.request_failed:
             self.cache.set(query, results)
         
         return results
@@ -279,40 +673,14 @@ class AdvancedGoogleDorkClient:
             }
             
             headers = self._get_random_headers()
-            proxy = self.proxies.get_next_proxy() if self.proxies else None
-            
-            response = self.session.get(
+            response = self._request(
                 url,
                 params=params,
                 headers=headers,
-                proxies=proxy,
-                timeout=self.timeout,
                 allow_redirects=True
             )
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
             
-            for result in soup.find_all('div', class_='g'):
-                try:
-                    title_elem = result.find('h3')
-                    link_elem = result.find('a')
-                    snippet_elem = result.find('span', class_='st')
-                    
-                    if title_elem and link_elem:
-                        title = title_elem.get_text(strip=True)
-                        url_str = link_elem.get('href', '')
-                        snippet = snippet_elem.get_text(strip=True) if snippet_elem else 'N/A'
-                        
-                        if url_str and 'google.com' not in url_str and url_str.startswith('http'):
-                            results.append({
-                                'title': title,
-                                'url': url_str,
-                                'snippet': snippet,
-                                'domain': urlparse(url_str).netloc,
-                            })
-                except Exception:
-                    continue
+            results = parse_google_results(response.content)
         except Exception as e:
             click.echo(f'Search error for "{query}": {str(e)}', err=True)
         
@@ -327,31 +695,26 @@ class AdvancedGoogleDorkClient:
         try:
             headers = {
                 'Ocp-Apim-Subscription-Key': self.bing_api_key,
-                'User-Agent': random.choice(self.USER_AGENTS),
+                'User-Agent': self._rng.choice(self.USER_AGENTS),
             }
             params = {
                 'q': query,
                 'count': 10,
                 'offset': 0,
             }
-            proxy = self.proxies.get_next_proxy() if self.proxies else None
-            
-            response = self.session.get(
+            response = self._request(
                 self.bing_endpoint,
                 headers=headers,
-                params=params,
-                proxies=proxy,
-                timeout=self.timeout
+                params=params
             )
-            response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             for item in data.get('webPages', {}).get('value', []):
                 url_str = item.get('url', '')
                 results.append({
                     'title': item.get('name', ''),
                     'url': url_str,
                     'snippet': item.get('snippet', '') or item.get('description', ''),
-                    'domain': urlparse(url_str).netloc if url_str else '',
+                    'domain': extract_domain(url_str),
                 })
         except Exception as e:
             click.echo(f'Search error for "{query}": {str(e)}', err=True)
@@ -367,30 +730,26 @@ class AdvancedGoogleDorkClient:
         try:
             headers = {
                 'X-Subscription-Token': self.brave_api_key,
-                'User-Agent': random.choice(self.USER_AGENTS),
+                'User-Agent': self._rng.choice(self.USER_AGENTS),
             }
             params = {
                 'q': query,
                 'count': 10,
                 'offset': 0,
             }
-            proxy = self.proxies.get_next_proxy() if self.proxies else None
-            response = self.session.get(
+            response = self._request(
                 self.brave_endpoint,
                 headers=headers,
-                params=params,
-                proxies=proxy,
-                timeout=self.timeout
+                params=params
             )
-            response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             for item in data.get('web', {}).get('results', []):
                 url_str = item.get('url', '')
                 results.append({
                     'title': item.get('title', ''),
                     'url': url_str,
                     'snippet': item.get('description', '') or item.get('snippet', ''),
-                    'domain': urlparse(url_str).netloc if url_str else '',
+                    'domain': extract_domain(url_str),
                 })
         except Exception as e:
             click.echo(f'Search error for "{query}": {str(e)}', err=True)
@@ -405,31 +764,12 @@ class AdvancedGoogleDorkClient:
                 'q': query,
             }
             headers = self._get_random_headers()
-            proxy = self.proxies.get_next_proxy() if self.proxies else None
-            response = self.session.get(
+            response = self._request(
                 url,
                 params=params,
-                headers=headers,
-                proxies=proxy,
-                timeout=self.timeout
+                headers=headers
             )
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            for result in soup.select('div.result'):
-                link = result.select_one('a.result__a')
-                if not link:
-                    continue
-                title = link.get_text(strip=True)
-                url_str = link.get('href', '')
-                snippet_elem = result.select_one('.result__snippet')
-                snippet = snippet_elem.get_text(strip=True) if snippet_elem else 'N/A'
-                if url_str and url_str.startswith('http'):
-                    results.append({
-                        'title': title,
-                        'url': url_str,
-                        'snippet': snippet,
-                        'domain': urlparse(url_str).netloc,
-                    })
+            results = parse_duckduckgo_results(response.content)
         except Exception as e:
             click.echo(f'Search error for "{query}": {str(e)}', err=True)
         
@@ -443,7 +783,7 @@ class AdvancedGoogleDorkClient:
         results = []
         try:
             headers = {
-                'User-Agent': random.choice(self.USER_AGENTS),
+                'User-Agent': self._rng.choice(self.USER_AGENTS),
             }
             base_url = self.searxng_endpoint.rstrip('/')
             url = f'{base_url}/search'
@@ -453,23 +793,19 @@ class AdvancedGoogleDorkClient:
             }
             if self.searxng_api_key:
                 params['api_key'] = self.searxng_api_key
-            proxy = self.proxies.get_next_proxy() if self.proxies else None
-            response = self.session.get(
+            response = self._request(
                 url,
                 headers=headers,
-                params=params,
-                proxies=proxy,
-                timeout=self.timeout
+                params=params
             )
-            response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             for item in data.get('results', []):
                 url_str = item.get('url', '')
                 results.append({
                     'title': item.get('title', ''),
                     'url': url_str,
                     'snippet': item.get('content', '') or item.get('snippet', ''),
-                    'domain': urlparse(url_str).netloc if url_str else '',
+                    'domain': extract_domain(url_str),
                 })
         except Exception as e:
             click.echo(f'Search error for "{query}": {str(e)}', err=True)
@@ -477,41 +813,72 @@ class AdvancedGoogleDorkClient:
         return results
     
     def search_multiple(self, queries: List[str], progress: bool = True) -> Dict:
-        """Search multiple queries with progress tracking"""
+        """Search multiple queries concurrently with progress tracking"""
         all_results = {}
-        if progress:
-            with click.progressbar(queries, label='Searching') as iterator:
-                for query in iterator:
-                    all_results[query] = self.search(query)
-        else:
-            for query in queries:
-                click.echo(f'Searching: {query}')
-                all_results[query] = self.search(query)
+        # Duplicate queries are searched once (dict keeps first-seen order)
+        unique_queries = list(dict.fromkeys(queries))
+        
+        # Serve cache hits up front so workers only ever wait on the network
+        if self.cache:
+            for query in unique_queries:
+                cached = self.cache.get(query)
+                if cached:
+                    all_results[query] = cached
+        pending = [query for query in unique_queries if query not in all_results]
         
-        return all_results
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = {}
+            for query in pending:
+                if not progress:
+                    click.echo(f'Searching: {query}')
+                futures[executor.submit(self.search, query)] = query
+            
+            if progress:
+                with click.progressbar(length=len(unique_queries), label='Searching') as bar:
+                    bar.update(len(all_results))
+                    for future in as_completed(futures):
+                        all_results[futures[future]] = future.result()
+                        bar.update(1)
+            else:
+                for future in as_completed(futures):
+                    all_results[futures[future]] = future.result()
+        
+        # Keep the original query order for output files
+        return {query: all_results[query] for query in unique_queries}
+
+
+def _csv_rows(results: Dict[str, List[Dict]]):
+    """Yield one CSV row per result item"""
+    for query, items in results.items():
+        for item in items:
+            yield (
+                query,
+                item.get('title', ''),
+                item.get('url', ''),
+                item.get('domain', ''),
+                item.get('snippet', ''),
+            )
 
 
 def save_to_csv(results: Dict[str, List[Dict]], output_file: str):
     """Save results to CSV"""
+    # Render in memory, then hand the file one write
+    buffer = io.StringIO(newline='')
+    writer = csv.writer(buffer)
+    writer.writerow(['Query', 'Title', 'URL', 'Domain', 'Snippet'])
+    writer.writerows(_csv_rows(results))
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(['Query', 'Title', 'URL', 'Domain', 'Snippet'])
-        
-        for query, items in results.items():
-            for item in items:
-                writer.writerow([
-                    query,
-                    item.get('title', ''),
-                    item.get('url', ''),
-                    item.get('domain', ''),
-                    item.get('snippet', ''),
-                ])
+        f.write(buffer.getvalue())
 
 
 def save_to_json(results: Dict[str, List[Dict]], output_file: str):
     """Save results to JSON"""
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        data = orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(results, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(output_file, 'wb') as f:
+        f.write(data)
 
 
 @click.command(no_args_is_help=True)
@@ -525,6 +892,8 @@ def save_to_json(results: Dict[str, List[Dict]], output_file: str):
               help='Output file prefix')
 @click.option('--delay', '-d', type=float, default=2.0,
               help='Delay between requests (seconds)')
+@click.option('--concurrency', '-c', type=click.IntRange(min=1), default=4,
+              help='Number of searches to run in parallel')
 @click.option('--proxies', '-p', type=click.Path(exists=True), default=None,
               help='Path to proxies file (one per line)')
 @click.option('--cache', is_flag=True, default=False,
@@ -535,7 +904,7 @@ def save_to_json(results: Dict[str, List[Dict]], output_file: str):
               help='Save to JSON')
 @click.option('--console', is_flag=True, default=False,
               help='Print to console')
-def main(file, target, engine, output, delay, proxies, cache, output_csv, output_json, console):
+def main(file, target, engine, output, delay, concurrency, proxies, cache, output_csv, output_json, console):
     """
     Advanced Google Dork CLI Tool with Proxy & Cache Support
     """
@@ -558,6 +927,11 @@ def main(file, target, engine, output, delay, proxies, cache, output_csv, output
     if target:
         queries = [f'site:{target} {query}' for query in queries]
     
+    # Drop repeated dorks up front so each is only searched and reported once
+    unique_queries = list(dict.fromkeys(queries))
+    duplicates = len(queries) - len(unique_queries)
+    queries = unique_queries
+    
     config_path = 'config.json'
     engine = engine.lower()
     bing_config = resolve_bing_config(config_path)
@@ -581,8 +955,11 @@ def main(file, target, engine, output, delay, proxies, cache, output_csv, output
         proxy_rotation.load_from_file(proxies)
     
     click.echo(f'Queries: {len(queries)}')
+    if duplicates:
+        click.echo(f'Duplicates skipped: {duplicates}')
     click.echo(f'Engine: {engine}')
     click.echo(f'Delay: {delay}s')
+    click.echo(f'Concurrency: {concurrency}')
     click.echo(f'Cache: {"Enabled" if cache else "Disabled"}')
     if proxies:
         click.echo(f'Proxies: {len(proxy_rotation.proxy_list)}')
@@ -592,6 +969,7 @@ def main(file, target, engine, output, delay, proxies, cache, output_csv, output
     # Perform searches
     client = AdvancedGoogleDorkClient(
         delay=delay,
+        concurrency=concurrency,
         use_cache=cache,
         proxies=proxy_rotation,
         engine=engine,
@@ -621,14 +999,15 @@ def main(file, target, engine, output, delay, proxies, cache, output_csv, output
                 click.echo(f'  {i}. {item["title"][:60]}...')
                 click.echo(f'     {item["url"][:70]}...')
     
-    # Save files
+    # Save files (one timestamp so the CSV and JSON names always match)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     if output_csv:
-        csv_file = f'{output}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+        csv_file = f'{output}_{timestamp}.csv'
         save_to_csv(results, csv_file)
         click.echo(f'✓ CSV: {csv_file}')
     
     if output_json:
-        json_file = f'{output}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+        json_file = f'{output}_{timestamp}.json'
         save_to_json(results, json_file)
         click.echo(f'✓ JSON: {json_file}')
 
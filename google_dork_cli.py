@@ -5,22 +5,89 @@ Performs Google dork searches with bot detection bypass using user-agent rotatio
 """
 
 import os
+import re
 import json
 import csv
 import time
+import hashlib
 import random
+import threading
 import click
 import requests
-from urllib.parse import quote
+import soupsieve
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import quote, unquote
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:  # optional, html.parser is pure Python but always available
+    HTML_PARSER = 'html.parser'
 
 
 DEFAULT_BING_ENDPOINT = "https://api.bing.microsoft.com/v7.0/search"
 DEFAULT_BRAVE_ENDPOINT = "https://api.search.brave.com/res/v1/web/search"
 DEFAULT_SEARXNG_ENDPOINT = "http://localhost:8080"
 
+# CSS selectors compiled once instead of on every parsed page
+GOOGLE_RESULT_SELECTOR = soupsieve.compile('div.g')
+GOOGLE_TITLE_SELECTOR = soupsieve.compile('h3')
+GOOGLE_LINK_SELECTOR = soupsieve.compile('a')
+GOOGLE_SNIPPET_SELECTOR = soupsieve.compile('span.st')
+DDG_RESULT_SELECTOR = soupsieve.compile('div.result')
+DDG_LINK_SELECTOR = soupsieve.compile('a.result__a')
+DDG_SNIPPET_SELECTOR = soupsieve.compile('.result__snippet')
+
+HTTP_SCHEMES = ('http://', 'https://')
+
+# Result links on these hosts (and subdomains) are Google's own pages
+GOOGLE_HOSTS = ('google.com', 'googleusercontent.com')
+
+# scheme://netloc prefix of an absolute URL
+NETLOC_RE = re.compile(r'\A[A-Za-z][A-Za-z0-9+.-]*://([^/?#]*)')
+# DuckDuckGo wraps result links in a redirect carrying the real URL in uddg=
+DDG_REDIRECT_TARGET = re.compile(r'\A(?:https?:)?//duckduckgo\.com/l/\?(?:[^#]*&)?uddg=([^&#]+)').match
+
+# A quoted operator value without spaces, e.g. inurl:"admin.php"; quotes on a
+# bare word request an exact match, so those are left alone
+QUOTED_OPERATOR_VALUE = re.compile(r'\b([A-Za-z]+):"([^"\s]+)"')
+# Only the uppercase spellings are boolean operators; "or" is a plain word
+BOOLEAN_OPERATORS = frozenset({'OR', 'AND'})
+
+
+def has_class(name: str):
+    """Strainer predicate; while parsing, bs4 passes the raw unsplit class string"""
+    return lambda value: value is not None and name in value.split()
+
+
+# Only build tree nodes for result blocks; the rest of the page is skipped
+GOOGLE_RESULT_STRAINER = SoupStrainer('div', class_=has_class('g'))
+DDG_RESULT_STRAINER = SoupStrainer('div', class_=has_class('result'))
+
+
+def json_dumps(data) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def json_loads(data: bytes):
+    """Deserialize JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def load_config(path: str) -> Dict:
     if not path:
@@ -28,8 +95,8 @@ def load_config(path: str) -> Dict:
     if not os.path.exists(path):
         return {}
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return json_loads(f.read())
     except Exception:
         return {}
 
@@ -43,8 +110,7 @@ def get_config_value(config: Dict, keys: List[str], default=None):
     return value
 
 
-def resolve_bing_config(config_path: str) -> Dict[str, Optional[str]]:
-    config = load_config(config_path)
+def resolve_bing_config(config: Dict) -> Dict[str, Optional[str]]:
     api_key = os.getenv("BING_API_KEY") or get_config_value(config, ["bing", "api_key"])
     endpoint = os.getenv("BING_ENDPOINT") or get_config_value(
         config, ["bing", "endpoint"], DEFAULT_BING_ENDPOINT
@@ -54,8 +120,7 @@ def resolve_bing_config(config_path: str) -> Dict[str, Optional[str]]:
     return {"api_key": api_key, "endpoint": endpoint}
 
 
-def resolve_brave_config(config_path: str) -> Dict[str, Optional[str]]:
-    config = load_config(config_path)
+def resolve_brave_config(config: Dict) -> Dict[str, Optional[str]]:
     api_key = os.getenv("BRAVE_API_KEY") or get_config_value(config, ["brave", "api_key"])
     endpoint = os.getenv("BRAVE_ENDPOINT") or get_config_value(
         config, ["brave", "endpoint"], DEFAULT_BRAVE_ENDPOINT
@@ -65,8 +130,7 @@ def resolve_brave_config(config_path: str) -> Dict[str, Optional[str]]:
     return {"api_key": api_key, "endpoint": endpoint}
 
 
-def resolve_searxng_config(config_path: str) -> Dict[str, Optional[str]]:
-    config = load_config(config_path)
+def resolve_searxng_config(config: Dict) -> Dict[str, Optional[str]]:
     api_key = os.getenv("SEARXNG_API_KEY") or get_config_value(config, ["searxng", "api_key"])
     endpoint = os.getenv("SEARXNG_ENDPOINT") or get_config_value(
         config, ["searxng", "endpoint"], DEFAULT_SEARXNG_ENDPOINT
@@ -76,6 +140,130 @@ def resolve_searxng_config(config_path: str) -> Dict[str, Optional[str]]:
     return {"api_key": api_key, "endpoint": endpoint}
 
 
+def extract_domain(url: str) -> str:
+    """Return the netloc of a URL without building a full urlparse result"""
+    match = NETLOC_RE.match(url)
+    return match.group(1) if match else ''
+
+
+def is_google_host(domain: str) -> bool:
+    """True if a netloc (as returned by extract_domain) belongs to Google"""
+    host = domain.rpartition('@')[2].partition(':')[0].lower()
+    return any(host == name or host.endswith('.' + name) for name in GOOGLE_HOSTS)
+
+
+def parse_google_results(html: bytes) -> List[Dict[str, str]]:
+    """Extract organic results from a Google SERP"""
+    results = []
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=GOOGLE_RESULT_STRAINER)
+    for result in GOOGLE_RESULT_SELECTOR.select(soup):
+        title_elem = GOOGLE_TITLE_SELECTOR.select_one(result)
+        link_elem = GOOGLE_LINK_SELECTOR.select_one(result)
+        if title_elem is None or link_elem is None:
+            continue
+        
+        url = link_elem.get('href', '')
+        # Skip relative links and Google's own pages
+        if not url.startswith(HTTP_SCHEMES) or is_google_host(extract_domain(url)):
+            continue
+        
+        snippet_elem = GOOGLE_SNIPPET_SELECTOR.select_one(result)
+        results.append({
+            'title': title_elem.get_text(strip=True),
+            'url': url,
+            'snippet': snippet_elem.get_text(strip=True) if snippet_elem else 'N/A',
+        })
+    return results
+
+
+def parse_duckduckgo_results(html: bytes) -> List[Dict[str, str]]:
+    """Extract results from a DuckDuckGo HTML results page"""
+    results = []
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=DDG_RESULT_STRAINER)
+    for result in DDG_RESULT_SELECTOR.select(soup):
+        link = DDG_LINK_SELECTOR.select_one(result)
+        if not link:
+            continue
+        url = link.get('href', '')
+        redirect = DDG_REDIRECT_TARGET(url)
+        if redirect:
+            url = unquote(redirect.group(1))
+        if not url.startswith('http'):
+            continue
+        
+        snippet_elem = DDG_SNIPPET_SELECTOR.select_one(result)
+        results.append({
+            'title': link.get_text(strip=True),
+            'url': url,
+            'snippet': snippet_elem.get_text(strip=True) if snippet_elem else 'N/A',
+        })
+    return results
+
+
+def normalize_query(query: str) -> str:
+    """Fold spelling-only variants of a dork (case, spacing, quotes around an operator value) together"""
+    unquoted = QUOTED_OPERATOR_VALUE.sub(r'\1:\2', query)
+    return ' '.join(
+        token if token in BOOLEAN_OPERATORS else token.lower()
+        for token in unquoted.split()
+    )
+
+
+class RateLimiter:
+    """Spaces out request start times across all worker threads"""
+    
+    def __init__(self, delay: float, jitter: float = 1.0, rng: Optional[random.Random] = None):
+        self.delay = delay
+        self.jitter = jitter
+        self._rng = rng or random.Random()
+        self._next_slot = 0.0  # monotonic time of the next free request slot
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Block until this caller's request slot comes up"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.delay + self._rng.uniform(0, self.jitter)
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class ResultCache:
+    """On-disk cache of search results, one JSON file per query"""
+    
+    def __init__(self, cache_dir: str = '.dork_cache', ttl: float = 86400):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def _path(self, key: str) -> str:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f'{digest}.json')
+    
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """Get cached results, or None when missing or expired"""
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) >= self.ttl:
+                return None
+            with open(path, 'rb') as f:
+                return json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    def set(self, key: str, results: List[Dict]):
+        """Cache results; written to a temp file first so readers never see a partial entry"""
+        path = self._path(key)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(json_dumps(results))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            click.echo(f'Cache write error: {str(e)}', err=True)
+
+
 class GoogleDorkClient:
     """Client for performing Google dork searches with user-agent rotation"""
     
@@ -97,6 +285,16 @@ class GoogleDorkClient:
         'https://duckduckgo.com/',
     ]
     
+    # Browser headers sent with every HTML search; only User-Agent and Referer rotate
+    BASE_HEADERS = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+    }
+    
     def __init__(
         self,
         delay: float = 2.0,
@@ -108,6 +306,10 @@ class GoogleDorkClient:
         brave_endpoint: Optional[str] = None,
         searxng_api_key: Optional[str] = None,
         searxng_endpoint: Optional[str] = None,
+        concurrency: int = 4,
+        use_cache: bool = False,
+        cache_ttl: float = 86400,
+        fuzzy_cache: bool = False,
     ):
         """
         Initialize the search client
@@ -118,9 +320,14 @@ class GoogleDorkClient:
             engine: Search engine to use (google or bing)
             bing_api_key: Bing Web Search API key
             bing_endpoint: Bing Web Search API endpoint
+            concurrency: Number of searches to run in parallel
+            use_cache: Reuse results of earlier runs from the on-disk cache
+            cache_ttl: Seconds before a cached result expires
+            fuzzy_cache: Let near-identical dorks share one cache entry
         """
         self.delay = delay
         self.timeout = timeout
+        self.concurrency = max(1, concurrency)
         self.engine = engine.lower()
         self.bing_api_key = bing_api_key
         self.bing_endpoint = bing_endpoint or DEFAULT_BING_ENDPOINT
@@ -128,22 +335,67 @@ class GoogleDorkClient:
         self.brave_endpoint = brave_endpoint or DEFAULT_BRAVE_ENDPOINT
         self.searxng_api_key = searxng_api_key
         self.searxng_endpoint = searxng_endpoint or DEFAULT_SEARXNG_ENDPOINT
+        # Private generator: no contention on the module-level random state
+        self._rng = random.Random()
+        # Shared by all worker threads, so --delay holds across the whole run;
+        # its jitter comes from the same private generator
+        self.rate_limiter = RateLimiter(delay, rng=self._rng)
         self.session = requests.Session()
+        # Default pool keeps only 10 connections per host; size it for the worker threads
+        adapter = HTTPAdapter(
+            pool_connections=self.concurrency,
+            pool_maxsize=self.concurrency * 2,
+            pool_block=False,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+                # A 503 Retry-After would otherwise hold the worker for the server's full wait
+                respect_retry_after_header=False,
+                raise_on_status=False
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.cache = ResultCache(ttl=cache_ttl) if use_cache else None
+        self.fuzzy_cache = fuzzy_cache
         
     def _get_random_headers(self) -> Dict:
         """Generate random headers for the request"""
         return {
-            'User-Agent': random.choice(self.USER_AGENTS),
-            'Referer': random.choice(self.REFERERS),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
+            **self.BASE_HEADERS,
+            'User-Agent': self._rng.choice(self.USER_AGENTS),
+            'Referer': self._rng.choice(self.REFERERS),
         }
     
+    def _endpoint(self) -> str:
+        """Endpoint queried by the selected engine, part of the cache key"""
+        if self.engine == "bing":
+            return self.bing_endpoint
+        if self.engine == "brave":
+            return self.brave_endpoint
+        if self.engine == "searxng":
+            return self.searxng_endpoint
+        return self.engine
+
     def search(self, query: str) -> List[Dict[str, str]]:
+        if self.cache is None:
+            return self._search_engine(query)
+        
+        cache_query = normalize_query(query) if self.fuzzy_cache else query
+        key = f'{self.engine}|{self._endpoint()}|{cache_query}'
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        results = self._search_engine(query)
+        # Empty results also cover request errors; leave those to hit the network again
+        if results:
+            self.cache.set(key, results)
+        return results
+
+    def _search_engine(self, query: str) -> List[Dict[str, str]]:
         if self.engine == "bing":
             return self._search_bing(query)
         if self.engine == "brave":
@@ -158,11 +410,9 @@ class GoogleDorkClient:
         """
         Perform a Google search for the given dork query
         """
-        results = []
-        
         try:
-            # Add random delay to avoid bot detection
-            time.sleep(self.delay + random.uniform(0, 1))
+            # Wait for this request's slot; pacing helps avoid bot detection
+            self.rate_limiter.wait()
             
             # Use Google search with parameters
             url = 'https://www.google.com/search'
@@ -182,32 +432,7 @@ class GoogleDorkClient:
             )
             response.raise_for_status()
             
-            # Parse the HTML response
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract search results
-            for result in soup.find_all('div', class_='g'):
-                try:
-                    title_elem = result.find('h3')
-                    link_elem = result.find('a')
-                    snippet_elem = result.find('span', class_='st')
-                    
-                    if title_elem and link_elem:
-                        title = title_elem.get_text(strip=True)
-                        url = link_elem.get('href', '')
-                        snippet = snippet_elem.get_text(strip=True) if snippet_elem else 'N/A'
-                        
-                        # Skip Google search result pages
-                        if url and 'google.com' not in url and url.startswith('http'):
-                            results.append({
-                                'title': title,
-                                'url': url,
-                                'snippet': snippet,
-                            })
-                except Exception:
-                    continue
-            
-            return results
+            return parse_google_results(response.content)
             
         except requests.exceptions.RequestException as e:
             click.echo(f'Error searching for "{query}": {str(e)}', err=True)
@@ -220,21 +445,12 @@ class GoogleDorkClient:
         if not self.bing_api_key:
             click.echo('Bing API key is missing. Set BING_API_KEY or config.json.', err=True)
             return []
-
-    def _search_brave(self, query: str) -> List[Dict[str, str]]:
-        """
-        Perform a Brave Search API query
-        """
-        if not self.brave_api_key:
-            click.echo('Brave API key is missing. Set BRAVE_API_KEY or config.json.', err=True)
-            return []
         
-        results = []
         try:
-            time.sleep(self.delay + random.uniform(0, 1))
+            self.rate_limiter.wait()
             headers = {
-                'X-Subscription-Token': self.brave_api_key,
-                'User-Agent': random.choice(self.USER_AGENTS),
+                'Ocp-Apim-Subscription-Key': self.bing_api_key,
+                'User-Agent': self._rng.choice(self.USER_AGENTS),
             }
             params = {
                 'q': query,
@@ -242,30 +458,38 @@ class GoogleDorkClient:
                 'offset': 0,
             }
             response = self.session.get(
-                self.brave_endpoint,
+                self.bing_endpoint,
                 headers=headers,
                 params=params,
                 timeout=self.timeout
             )
             response.raise_for_status()
-            data = response.json()
-            for item in data.get('web', {}).get('results', []):
-                results.append({
-                    'title': item.get('title', ''),
+            data = json_loads(response.content)
+            return [
+                {
+                    'title': item.get('name', ''),
                     'url': item.get('url', ''),
-                    'snippet': item.get('description', '') or item.get('snippet', ''),
-                })
-            return results
-        except requests.exceptions.RequestException as e:
+                    'snippet': item.get('snippet', '') or item.get('description', ''),
+                }
+                for item in data.get('webPages', {}).get('value', ())
+            ]
+        except (requests.exceptions.RequestException, ValueError) as e:
             click.echo(f'Error searching for "{query}": {str(e)}', err=True)
             return []
+
+    def _search_brave(self, query: str) -> List[Dict[str, str]]:
+        """
+        Perform a Brave Search API query
+        """
+        if not self.brave_api_key:
+            click.echo('Brave API key is missing. Set BRAVE_API_KEY or config.json.', err=True)
+            return []
         
-        results = []
         try:
-            time.sleep(self.delay + random.uniform(0, 1))
+            self.rate_limiter.wait()
             headers = {
-                'Ocp-Apim-Subscription-Key': self.bing_api_key,
-                'User-Agent': random.choice(self.USER_AGENTS),
+                'X-Subscription-Token': self.brave_api_key,
+                'User-Agent': self._rng.choice(self.USER_AGENTS),
             }
             params = {
                 'q': query,
@@ -273,21 +497,22 @@ class GoogleDorkClient:
                 'offset': 0,
             }
             response = self.session.get(
-                self.bing_endpoint,
+                self.brave_endpoint,
                 headers=headers,
                 params=params,
                 timeout=self.timeout
             )
             response.raise_for_status()
-            data = response.json()
-            for item in data.get('webPages', {}).get('value', []):
-                results.append({
-                    'title': item.get('name', ''),
+            data = json_loads(response.content)
+            return [
+                {
+                    'title': item.get('title', ''),
                     'url': item.get('url', ''),
-                    'snippet': item.get('snippet', '') or item.get('description', ''),
-                })
-            return results
-        except requests.exceptions.RequestException as e:
+                    'snippet': item.get('description', '') or item.get('snippet', ''),
+                }
+                for item in data.get('web', {}).get('results', ())
+            ]
+        except (requests.exceptions.RequestException, ValueError) as e:
             click.echo(f'Error searching for "{query}": {str(e)}', err=True)
             return []
 
@@ -295,9 +520,8 @@ class GoogleDorkClient:
         """
         Perform a DuckDuckGo search using the HTML endpoint
         """
-        results = []
         try:
-            time.sleep(self.delay + random.uniform(0, 1))
+            self.rate_limiter.wait()
             url = 'https://duckduckgo.com/html/'
             params = {
                 'q': query,
@@ -310,22 +534,7 @@ class GoogleDorkClient:
                 timeout=self.timeout
             )
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            for result in soup.select('div.result'):
-                link = result.select_one('a.result__a')
-                if not link:
-                    continue
-                title = link.get_text(strip=True)
-                url_str = link.get('href', '')
-                snippet_elem = result.select_one('.result__snippet')
-                snippet = snippet_elem.get_text(strip=True) if snippet_elem else 'N/A'
-                if url_str and url_str.startswith('http'):
-                    results.append({
-                        'title': title,
-                        'url': url_str,
-                        'snippet': snippet,
-                    })
-            return results
+            return parse_duckduckgo_results(response.content)
         except requests.exceptions.RequestException as e:
             click.echo(f'Error searching for "{query}": {str(e)}', err=True)
             return []
@@ -338,11 +547,10 @@ class GoogleDorkClient:
             click.echo('SearXNG endpoint is missing. Set SEARXNG_ENDPOINT or config.json.', err=True)
             return []
         
-        results = []
         try:
-            time.sleep(self.delay + random.uniform(0, 1))
+            self.rate_limiter.wait()
             headers = {
-                'User-Agent': random.choice(self.USER_AGENTS),
+                'User-Agent': self._rng.choice(self.USER_AGENTS),
             }
             base_url = self.searxng_endpoint.rstrip('/')
             url = f'{base_url}/search'
@@ -359,15 +567,16 @@ class GoogleDorkClient:
                 timeout=self.timeout
             )
             response.raise_for_status()
-            data = response.json()
-            for item in data.get('results', []):
-                results.append({
+            data = json_loads(response.content)
+            return [
+                {
                     'title': item.get('title', ''),
                     'url': item.get('url', ''),
                     'snippet': item.get('content', '') or item.get('snippet', ''),
-                })
-            return results
-        except requests.exceptions.RequestException as e:
+                }
+                for item in data.get('results', ())
+            ]
+        except (requests.exceptions.RequestException, ValueError) as e:
             click.echo(f'Error searching for "{query}": {str(e)}', err=True)
             return []
     
@@ -382,40 +591,63 @@ class GoogleDorkClient:
         Returns:
             Dictionary with query as key and list of results as value
         """
-        all_results = {}
+        # Duplicate queries are searched once (dict keeps first-seen order);
+        # blank ones have nothing to search for
+        unique_queries = list(dict.fromkeys(queries))
+        all_results = {query: [] for query in unique_queries if not query.strip()}
         
-        if progress:
-            with click.progressbar(queries, label='Searching') as iterator:
-                for query in iterator:
-                    all_results[query] = self.search(query)
-        else:
-            for query in queries:
-                click.echo(f'Searching: {query}')
-                all_results[query] = self.search(query)
+        # Workers overlap slow responses; the rate limiter still spaces out request starts
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = {}
+            for query in unique_queries:
+                if query in all_results:
+                    continue
+                if not progress:
+                    click.echo(f'Searching: {query}')
+                futures[executor.submit(self.search, query)] = query
+            
+            if progress:
+                with click.progressbar(length=len(futures), label='Searching') as bar:
+                    for future in as_completed(futures):
+                        all_results[futures[future]] = future.result()
+                        bar.update(1)
+            else:
+                for future in as_completed(futures):
+                    all_results[futures[future]] = future.result()
         
-        return all_results
+        # Keep the original query order for output files
+        return {query: all_results[query] for query in unique_queries}
+
+
+def _csv_rows(results: Dict[str, List[Dict]]):
+    """Yield one CSV row per result item"""
+    for query, items in results.items():
+        for item in items:
+            yield (
+                query,
+                item.get('title', ''),
+                item.get('url', ''),
+                item.get('snippet', ''),
+            )
 
 
 def save_to_csv(results: Dict[str, List[Dict]], output_file: str):
     """Save results to CSV file"""
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+    # 1 MiB buffer so large result sets reach the disk in a few writes
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(['Query', 'Title', 'URL', 'Snippet'])
-        
-        for query, items in results.items():
-            for item in items:
-                writer.writerow([
-                    query,
-                    item.get('title', ''),
-                    item.get('url', ''),
-                    item.get('snippet', ''),
-                ])
+        writer.writerows(_csv_rows(results))
 
 
 def save_to_json(results: Dict[str, List[Dict]], output_file: str):
     """Save results to JSON file"""
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        data = orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(results, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(output_file, 'wb') as f:
+        f.write(data)
 
 
 @click.command(no_args_is_help=True)
@@ -454,6 +686,30 @@ def save_to_json(results: Dict[str, List[Dict]], output_file: str):
     default=2.0,
     help='Minimum delay between requests in seconds. Default: 2.0'
 )
+@click.option(
+    '--concurrency',
+    '-c',
+    type=click.IntRange(min=1),
+    default=4,
+    help='Number of searches to run in parallel. Default: 4'
+)
+@click.option(
+    '--cache/--no-cache',
+    default=False,
+    help='Reuse results of earlier runs from .dork_cache/. Default: off'
+)
+@click.option(
+    '--cache-ttl',
+    type=click.FloatRange(min=0),
+    default=86400,
+    help='Seconds before a cached result expires. Default: 86400 (24 hours)'
+)
+@click.option(
+    '--fuzzy-cache',
+    is_flag=True,
+    default=False,
+    help='With --cache, treat dorks differing only in case, spacing or quotes around an operator value as the same'
+)
 @click.option(
     '--csv',
     'output_csv',
@@ -474,7 +730,7 @@ def save_to_json(results: Dict[str, List[Dict]], output_file: str):
     default=False,
     help='Print results to console'
 )
-def main(file, target, engine, output, delay, output_csv, output_json, console):
+def main(file, target, engine, output, delay, concurrency, cache, cache_ttl, fuzzy_cache, output_csv, output_json, console):
     """
     Google Dork CLI Tool
     
@@ -491,10 +747,11 @@ def main(file, target, engine, output, delay, output_csv, output_json, console):
     click.echo('🔍 Google Dork CLI Tool')
     click.echo('=' * 50)
     
-    # Read dork queries from file
+    # Read dork queries from file, adding the target domain if specified
+    prefix = f'site:{target} ' if target else ''
     try:
         with open(file, 'r', encoding='utf-8') as f:
-            queries = [line.strip() for line in f if line.strip()]
+            queries = [prefix + query for query in (line.strip() for line in f) if query]
     except Exception as e:
         click.echo(f'Error reading file: {str(e)}', err=True)
         return
@@ -503,15 +760,12 @@ def main(file, target, engine, output, delay, output_csv, output_json, console):
         click.echo('No queries found in file', err=True)
         return
     
-    # Add target domain to queries if specified
-    if target:
-        queries = [f'site:{target} {query}' for query in queries]
-    
-    config_path = 'config.json'
+    # Read config.json once and resolve every engine from the parsed dict
+    config = load_config('config.json')
     engine = engine.lower()
-    bing_config = resolve_bing_config(config_path)
-    brave_config = resolve_brave_config(config_path)
-    searxng_config = resolve_searxng_config(config_path)
+    bing_config = resolve_bing_config(config)
+    brave_config = resolve_brave_config(config)
+    searxng_config = resolve_searxng_config(config)
     if engine == 'bing' and not bing_config['api_key']:
         click.echo('Missing Bing API key. Set BING_API_KEY or update config.json.', err=True)
         return
@@ -523,16 +777,26 @@ def main(file, target, engine, output, delay, output_csv, output_json, console):
         return
     
     click.echo(f'Found {len(queries)} queries to search')
+    duplicates = len(queries) - len(set(queries))
+    if duplicates:
+        click.echo(f'Duplicates skipped: {duplicates}')
     click.echo(f'Engine: {engine}')
     if target:
         click.echo(f'Target domain: {target}')
     click.echo(f'Delay between requests: {delay}s')
+    click.echo(f'Concurrency: {concurrency}')
+    if cache:
+        click.echo(f'Cache: enabled (TTL {cache_ttl:g}s{", fuzzy" if fuzzy_cache else ""})')
     click.echo('=' * 50)
     click.echo()
     
     # Perform searches
     client = GoogleDorkClient(
         delay=delay,
+        concurrency=concurrency,
+        use_cache=cache,
+        cache_ttl=cache_ttl,
+        fuzzy_cache=fuzzy_cache,
         engine=engine,
         bing_api_key=bing_config['api_key'],
         bing_endpoint=bing_config['endpoint'],
@@ -565,9 +829,10 @@ def main(file, target, engine, output, delay, output_csv, output_json, console):
                 click.echo(f'     Snippet: {item["snippet"][:100]}...')
             click.echo()
     
-    # Save to files
+    # Save to files (one timestamp so the CSV and JSON names always match)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     if output_csv:
-        csv_file = f'{output}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+        csv_file = f'{output}_{timestamp}.csv'
         try:
             save_to_csv(results, csv_file)
             click.echo(f'✓ CSV results saved to: {csv_file}')
@@ -575,7 +840,7 @@ def main(file, target, engine, output, delay, output_csv, output_json, console):
             click.echo(f'Error saving CSV: {str(e)}', err=True)
     
     if output_json:
-        json_file = f'{output}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+        json_file = f'{output}_{timestamp}.json'
         try:
             save_to_json(results, json_file)
             click.echo(f'✓ JSON results saved to: {json_file}')